@@ -1,21 +1,83 @@
 import yfinance as yf
 import pandas as pd
-import pandas_ta as ta
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+import numpy as np
 import os
-import time
+import re
 import argparse
 
+from indicators import atr_2d, bbands, macd_2d, rsi_2d, sma_2d
+
+
+INDICATOR_COLUMNS = [
+    'rsi',
+    'BBL_20_2.0', 'BBM_20_2.0', 'BBU_20_2.0', 'BBB_20_2.0', 'BBP_20_2.0',
+    'MACD_12_26_9', 'MACDh_12_26_9', 'MACDs_12_26_9',
+    'sma_20', 'sma_50', 'sma_200',
+    'ema_12', 'ema_26',
+    'atr',
+]
+
+
+# Volume is kept as float64 until written, since the last bar may be missing.
+SUMMARY_DTYPES = {
+    'symbol': object,
+    'last_price': np.float32,
+    'daily_change_pct': np.float32,
+    'volume': np.float64,
+    'week_52_high': np.float32,
+    'week_52_low': np.float32,
+    'pct_from_high': np.float32,
+    'pct_from_low': np.float32,
+    'date': 'datetime64[D]',
+}
+
+
+def _compact_volume(volume):
+    """Return volume as int32 when it has no gaps and fits, else unchanged."""
+    if (np.isnan(volume).any() or
+            volume.max(initial=0) > np.iinfo(np.int32).max):
+        return volume
+    return volume.astype(np.int32)
+
+
+def _columns_contiguous(df):
+    """Whether every numeric column is backed by a contiguous array."""
+    return all(df[col].to_numpy().flags.c_contiguous
+               for col in df.select_dtypes('number'))
+
+
+def _stack_column(frames, column, dtype=np.float32):
+    """Stack one column of equal-length frames into a (bars, tickers) array."""
+    out = np.empty((len(frames[0]), len(frames)), dtype=dtype, order='F')
+    for j, df in enumerate(frames):
+        out[:, j] = df[column].to_numpy()
+    return out
+
 
 class StockAnalyzer:
-    def __init__(self, output_dir='stock_data'):
+    def __init__(self, output_dir='stock_data', use_cache=True,
+                 output_format='parquet'):
         self.output_dir = output_dir
+        self.output_format = output_format
+        self.cache_dir = os.path.join(output_dir, '_cache')
+        self.use_cache = use_cache
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
+        if use_cache and not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir)
     
     def fetch_data(self, symbols, period="1y", interval="1d"):
         """
         Fetch stock data for multiple symbols.
         
+        Symbols with a cached Parquet file only download the bars since the
+        last cached date; the rest are downloaded for the full period. A
+        cache is downloaded again in full when a split or dividend has
+        re-adjusted the prices since it was written.
+        
         Args:
             symbols (list): List of stock symbols
             period (str): Time period to fetch (default: 1 year)
@@ -24,81 +86,377 @@ class StockAnalyzer:
         Returns:
             dict: Dictionary of DataFrames with stock data
         """
-        stock_data = {}
+        cached = {}
+        if self.use_cache:
+            for symbol in symbols:
+                df = self._load_cache(symbol, period, interval)
+                if df is not None:
+                    cached[symbol] = df
         
-        for symbol in symbols:
-            try:
-                print(f"Fetching data for {symbol}...")
-                stock = yf.Ticker(symbol)
-                df = stock.history(period=period, interval=interval)
-                
-                if df.empty:
-                    print(f"No data found for {symbol}")
-                    continue
-                
-                df.columns = [col.lower() for col in df.columns]
-                
-                df['symbol'] = symbol
-                
-                stock_data[symbol] = df
-                print(f"Successfully fetched data for {symbol}")
-                
-                time.sleep(0.5)
-                
-            except Exception as e:
-                print(f"Error fetching data for {symbol}: {e}")
+        missing = [symbol for symbol in symbols if symbol not in cached]
+        fetched = {}
+        
+        if missing:
+            fetched.update(self._download(missing, period=period,
+                                          interval=interval))
+        
+        if cached:
+            start = min(df.index.max() for df in cached.values()).date()
+            updates = self._download(list(cached), start=start,
+                                     interval=interval)
+            
+            stale = []
+            for symbol, df in cached.items():
+                if symbol in updates:
+                    if self._cache_is_stale(df, updates[symbol]):
+                        stale.append(symbol)
+                        continue
+                    df = pd.concat([df, updates[symbol]])
+                    df = df[~df.index.duplicated(keep='last')]
+                fetched[symbol] = df
+                print(f"Loaded cached data for {symbol}")
+            
+            if stale:
+                print(f"Prices were re-adjusted for {', '.join(stale)}, "
+                      f"discarding cache")
+                fetched.update(self._download(stale, period=period,
+                                              interval=interval))
+        
+        # Fresh downloads and cache refreshes are trimmed the same way, so
+        # a rerun returns the same rows as the first run.
+        for symbol in list(fetched):
+            df = self._trim_to_period(fetched[symbol], period)
+            if df.empty:
+                print(f"No data found for {symbol}")
+                del fetched[symbol]
+            else:
+                fetched[symbol] = df
+        
+        # Every frame shares one set of categories, so the symbol column
+        # stays categorical when the frames are concatenated.
+        categories = pd.Index([symbol for symbol in dict.fromkeys(symbols)
+                               if symbol in fetched])
+        
+        stock_data = {}
+        for code, symbol in enumerate(categories):
+            df = fetched[symbol]
+            if self.use_cache:
+                self._save_cache(df, symbol, period, interval)
+            
+            codes = np.full(len(df), code, dtype=np.int32)
+            stock_data[symbol] = df.assign(
+                symbol=pd.Categorical.from_codes(codes, categories=categories))
         
         return stock_data
     
-    def add_technical_indicators(self, df):
+    def _download(self, symbols, **kwargs):
         """
-        Add technical indicators to the DataFrame.
+        Download price history for several symbols in one batched request.
         
         Args:
-            df (DataFrame): Stock price data
+            symbols (list): List of stock symbols
+            **kwargs: period/start and interval passed to yfinance
             
         Returns:
-            DataFrame: DataFrame with added technical indicators
+            dict: Dictionary of DataFrames with lower-case columns
         """
+        stock_data = {}
+        
+        print(f"Fetching data for {', '.join(symbols)}...")
         try:
-            df['rsi'] = ta.rsi(df['close'], length=14)
-            
-            bbands = ta.bbands(df['close'], length=20, std=2)
-            df = df.join(bbands)
-            
-            macd = ta.macd(df['close'], fast=12, slow=26, signal=9)
-            df = df.join(macd)
+            raw = yf.download(symbols, group_by='ticker', auto_adjust=True,
+                              actions=True, threads=True, progress=False,
+                              **kwargs)
+        except Exception as e:
+            print(f"Error fetching data: {e}")
+            return stock_data
+        
+        if not isinstance(raw.columns, pd.MultiIndex):
+            raw = pd.concat({symbols[0].upper(): raw}, axis=1)
+        
+        tickers = raw.columns.get_level_values(0)
+        
+        for symbol in symbols:
+            if symbol.upper() not in tickers:
+                print(f"No data found for {symbol}")
+                continue
             
-            df['sma_20'] = ta.sma(df['close'], length=20)
-            df['sma_50'] = ta.sma(df['close'], length=50)
-            df['sma_200'] = ta.sma(df['close'], length=200)
+            df = self._price_frame(raw[symbol.upper()])
             
-            df['ema_12'] = ta.ema(df['close'], length=12)
-            df['ema_26'] = ta.ema(df['close'], length=26)
+            if df.empty:
+                print(f"No data found for {symbol}")
+                continue
             
-            df['atr'] = ta.atr(df['high'], df['low'], df['close'], length=14)
+            stock_data[symbol] = df
+            print(f"Successfully fetched data for {symbol}")
+        
+        return stock_data
+    
+    @staticmethod
+    def _downcast(df):
+        """
+        Store prices and indicators as float32 and volume as int32.
+        
+        Volume keeps its dtype if it has gaps or does not fit in int32,
+        since float32 cannot represent large share counts exactly.
+        
+        Args:
+            df (DataFrame): Stock price data
             
-            df['date'] = df.index.date
-            df['year'] = df.index.year
-            df['month'] = df.index.month
-            df['day'] = df.index.day
-            df['day_of_week'] = df.index.dayofweek
-
-            df['daily_return'] = df['close'].pct_change() * 100
+        Returns:
+            DataFrame: DataFrame with downcast columns
+        """
+        df = df.astype({col: 'float32' for col in df.select_dtypes('float64')
+                        if col != 'volume'})
+        df['volume'] = _compact_volume(df['volume'].to_numpy())
+        return df
+    
+    @staticmethod
+    def _price_frame(block):
+        """
+        Build a typed price DataFrame from one ticker's downloaded columns.
+        
+        The values are read into a single NumPy array, rows with no data for
+        this ticker are dropped, and the typed columns are passed straight to
+        the DataFrame constructor instead of slicing, dropping and casting
+        the pandas frame.
+        
+        Args:
+            block (DataFrame): One ticker's columns from yf.download
             
-            df['volume_sma_20'] = ta.sma(df['volume'], length=20)
+        Returns:
+            DataFrame: Price data with lower-case float32 columns
+        """
+        values = block.to_numpy(dtype=np.float64)
+        rows = ~np.isnan(values).all(axis=1)
+        values = values[rows]
+        
+        columns = [col.lower() for col in block.columns]
+        data = dict(zip(columns, values.astype(np.float32).T))
+        if 'volume' in data:
+            volume = values[:, columns.index('volume')]
+            data['volume'] = _compact_volume(volume)
+        
+        return pd.DataFrame(data, index=block.index[rows])
+    
+    @staticmethod
+    def _cache_is_stale(cached, update):
+        """
+        Whether a refresh shows that the cached prices are out of date.
+        
+        Yahoo rescales the whole adjusted history after a split or dividend,
+        so cached rows cannot be extended once either happens. The cache is
+        stale if the refresh has a corporate action the cache does not, or
+        if an earlier overlapping bar no longer matches the cached close.
+        
+        Args:
+            cached (DataFrame): Cached price history
+            update (DataFrame): Bars downloaded since the last cached date
             
-            df['volume_above_avg'] = df['volume'] > df['volume_sma_20']
+        Returns:
+            bool: True if the cache must be downloaded again in full
+        """
+        last_cached = cached.index.max()
+        actions = [col for col in ('dividends', 'stock splits')
+                   if col in update.columns]
+        
+        recent = update.loc[update.index >= last_cached, actions].fillna(0)
+        known = cached.reindex(index=recent.index, columns=actions).fillna(0)
+        if (recent.to_numpy() != known.to_numpy()).any():
+            return True
+        
+        # The last cached bar may have been an unfinished session, so only
+        # the bars before it have to match exactly.
+        overlap = update.index[(update.index < last_cached) &
+                               update.index.isin(cached.index)]
+        return not np.allclose(update.loc[overlap, 'close'].to_numpy(),
+                               cached.loc[overlap, 'close'].to_numpy(),
+                               rtol=1e-4, equal_nan=True)
+    
+    def _cache_path(self, symbol, period, interval):
+        """Path of the Parquet cache file for a symbol/period/interval."""
+        return os.path.join(self.cache_dir,
+                            f"{symbol}_{period}_{interval}.parquet")
+    
+    def _load_cache(self, symbol, period, interval):
+        """Load cached price history, or None if there is no usable cache."""
+        path = self._cache_path(symbol, period, interval)
+        if not os.path.exists(path):
+            return None
+        
+        try:
+            df = pd.read_parquet(path)
+        except Exception as e:
+            print(f"Error reading cache for {symbol}: {e}")
+            return None
+        
+        return None if df.empty else df
+    
+    def _save_cache(self, df, symbol, period, interval):
+        """Write price history to the Parquet cache."""
+        path = self._cache_path(symbol, period, interval)
+        try:
+            df.to_parquet(path, compression='zstd')
+        except Exception as e:
+            print(f"Error writing cache for {symbol}: {e}")
+    
+    @staticmethod
+    def _trim_to_period(df, period):
+        """
+        Drop rows older than a yfinance period string.
+        
+        Day periods count trading sessions, as Yahoo does, so '5d' keeps the
+        bars of the last five distinct trading dates. Longer periods are
+        measured back from the start of today.
+        
+        Args:
+            df (DataFrame): Price history indexed by date
+            period (str): Period such as '5d', '6mo', '1y', 'ytd' or 'max'
             
+        Returns:
+            DataFrame: Rows that fall inside the period
+        """
+        today = pd.Timestamp.now(tz=df.index.tz).normalize()
+        if period == 'ytd':
+            return df[df.index >= today.replace(month=1, day=1)]
+        
+        match = re.fullmatch(r'(\d+)(d|wk|mo|y)', period)
+        if match is None or df.empty:
             return df
+        
+        count, unit = match.groups()
+        if unit == 'd':
+            sessions = df.index.normalize()
+            return df[sessions >= sessions.unique()[-int(count):].min()]
+        
+        units = {'wk': 'weeks', 'mo': 'months', 'y': 'years'}
+        start = today - pd.DateOffset(**{units[unit]: int(count)})
+        return df[df.index >= start]
+    
+    def add_technical_indicators(self, df):
+        """
+        Add technical indicators to the DataFrame.
+        
+        Args:
+            df (DataFrame): Stock price data
+            
+        Returns:
+            DataFrame: DataFrame with added technical indicators
+        """
+        try:
+            return self._with_indicators([df])[0]
             
         except Exception as e:
             print(f"Error adding technical indicators: {e}")
             return df
     
+    def add_technical_indicators_batch(self, stock_data):
+        """
+        Add technical indicators to several stocks at once.
+        
+        Stocks with the same number of bars are stacked into one
+        (bars, tickers) matrix per price column so each kernel runs once
+        for the whole group.
+        
+        Args:
+            stock_data (dict): Dictionary of DataFrames with stock data
+            
+        Returns:
+            dict: Dictionary of DataFrames with added technical indicators
+        """
+        groups = {}
+        for symbol, df in stock_data.items():
+            groups.setdefault(len(df), []).append(symbol)
+        
+        results = {}
+        for group in groups.values():
+            frames = [stock_data[symbol] for symbol in group]
+            try:
+                frames = self._with_indicators(frames)
+            except Exception as e:
+                print(f"Error adding technical indicators: {e}")
+            results.update(zip(group, frames))
+        
+        return {symbol: results[symbol] for symbol in stock_data}
+    
+    def _with_indicators(self, frames):
+        """
+        Compute indicators for DataFrames that all have the same length.
+        
+        Args:
+            frames (list): Stock price DataFrames of equal length
+            
+        Returns:
+            list: DataFrames with added technical indicators
+        """
+        close = _stack_column(frames, 'close')
+        high = _stack_column(frames, 'high')
+        low = _stack_column(frames, 'low')
+        # float32 cannot hold share counts above 2**24 exactly
+        volume = _stack_column(frames, 'volume', dtype=np.float64)
+        
+        # One (indicators, bars) slab per ticker, so that each indicator
+        # column is contiguous once the slab is handed to pandas transposed.
+        buf = np.empty((len(frames), len(INDICATOR_COLUMNS), len(close)),
+                       dtype=np.float32, order='C')
+        
+        buf[:, 0] = rsi_2d(close, 14).T
+        
+        for i, band in enumerate(bbands(close, 20, 2.0)):
+            buf[:, 1 + i] = band.T
+        
+        macd_line, macd_hist, macd_signal, ema_12, ema_26 = macd_2d(
+            close, 12, 26, 9)
+        buf[:, 6] = macd_line.T
+        buf[:, 7] = macd_hist.T
+        buf[:, 8] = macd_signal.T
+        
+        buf[:, 9] = sma_2d(close, 20).T
+        buf[:, 10] = sma_2d(close, 50).T
+        buf[:, 11] = sma_2d(close, 200).T
+        
+        buf[:, 12] = ema_12.T
+        buf[:, 13] = ema_26.T
+        
+        buf[:, 14] = atr_2d(high, low, close, 14).T
+        
+        daily_return = np.empty_like(close)
+        daily_return[0] = np.nan
+        np.subtract(close[1:], close[:-1], out=daily_return[1:])
+        daily_return[1:] /= close[:-1]
+        daily_return[1:] *= 100.0
+        
+        volume_sma_20 = sma_2d(volume, 20)
+        volume_above_avg = volume > volume_sma_20
+        
+        results = []
+        for j, df in enumerate(frames):
+            indicators_df = pd.DataFrame(buf[j].T, index=df.index,
+                                         columns=INDICATOR_COLUMNS,
+                                         copy=False)
+            
+            # Local wall-clock time, so intraday bars keep their trading date
+            idx = df.index.tz_localize(None)
+            
+            extra_df = pd.DataFrame({
+                'date': idx.values.astype('datetime64[D]'),
+                'year': idx.year.to_numpy(),
+                'month': idx.month.to_numpy(),
+                'day': idx.day.to_numpy(),
+                'day_of_week': idx.dayofweek.to_numpy(),
+                'daily_return': daily_return[:, j],
+                'volume_sma_20': volume_sma_20[:, j],
+                'volume_above_avg': volume_above_avg[:, j],
+            }, index=df.index)
+            
+            df = pd.concat([df, indicators_df, extra_df], axis=1)
+            results.append(self._downcast(df))
+        
+        return results
+    
     def process_all_stocks(self, symbols, period="1y", interval="1d"):
         """
-        Process all stocks and save the data to CSV files.
+        Process all stocks and save the data to Parquet or CSV files.
         
         Args:
             symbols (list): List of stock symbols
@@ -106,67 +464,124 @@ class StockAnalyzer:
             interval (str): Data interval
             
         Returns:
-            str: Path to the combined CSV file
+            str: Path to the combined output file
         """
         stock_data = self.fetch_data(symbols, period, interval)
-        all_stocks_df = pd.DataFrame()
+        frames = []
+        summary = {column: np.empty(len(stock_data), dtype=dtype)
+                   for column, dtype in SUMMARY_DTYPES.items()}
+        summary_count = 0
         
-        for symbol, df in stock_data.items():
-            df_with_indicators = self.add_technical_indicators(df)
+        stock_data = self.add_technical_indicators_batch(stock_data)
+        
+        for symbol in list(stock_data):
+            df_with_indicators = stock_data.pop(symbol)
             
-            output_path = os.path.join(self.output_dir, f"{symbol}_data.csv")
-            df_with_indicators.to_csv(output_path)
+            output_path = self.write_frame(df_with_indicators,
+                                           f"{symbol}_data")
             print(f"Saved data for {symbol} to {output_path}")
             
-            all_stocks_df = pd.concat([all_stocks_df, df_with_indicators])
+            if not df_with_indicators.empty:
+                self.fill_summary_row(summary, summary_count, symbol,
+                                      df_with_indicators)
+                summary_count += 1
+            frames.append(df_with_indicators)
+        
+        all_stocks_df = pd.concat(frames) if frames else pd.DataFrame()
+        if not _columns_contiguous(all_stocks_df):
+            all_stocks_df = all_stocks_df.copy()
         
-        combined_output_path = os.path.join(self.output_dir,
-                                            "all_stocks_data.csv")
-        all_stocks_df.to_csv(combined_output_path)
+        combined_output_path = self.write_frame(all_stocks_df,
+                                                "all_stocks_data",
+                                                streaming=True)
         print(f"Saved combined data to {combined_output_path}")
         
-        self.create_summary_table(stock_data, combined_output_path)
+        self.write_summary(summary, summary_count)
         
         return combined_output_path
     
-    def create_summary_table(self, stock_data, combined_output_path):
-        """Create a summary table with key metrics for each stock."""
-        summary_rows = []
+    def write_frame(self, df, name, index=True, streaming=False):
+        """
+        Write a DataFrame to the output directory in the configured format.
         
-        for symbol, df in stock_data.items():
-            if df.empty:
-                continue
+        Args:
+            df (DataFrame): Data to write
+            name (str): File name without extension
+            index (bool): Whether to write the index as a column
+            streaming (bool): Write CSV in batches instead of building the
+                whole text output in memory
+            
+        Returns:
+            str: Path to the written file
+        """
+        path = os.path.join(self.output_dir, f"{name}.{self.output_format}")
+        
+        if self.output_format == 'parquet':
+            table = pa.Table.from_pandas(df, preserve_index=index)
+            if 'date' in table.column_names:
+                table = table.set_column(
+                    table.column_names.index('date'), 'date',
+                    table['date'].cast(pa.date32()))
+            pq.write_table(table, path, compression='zstd')
+            return path
+        
+        # Keep the pandas text format: '2024-03-25 00:00:00-04:00' for
+        # timestamps and True/False for booleans.
+        frame = pl.from_pandas(df, include_index=index)
+        frame = frame.with_columns(
+            pl.col(pl.Boolean).cast(pl.String).str.to_titlecase())
+        if 'date' in frame.columns:
+            frame = frame.with_columns(pl.col('date').cast(pl.Date))
+        datetime_format = '%Y-%m-%d %H:%M:%S'
+        if any(getattr(dtype, 'time_zone', None) for dtype in frame.dtypes):
+            datetime_format += '%:z'
+        
+        if streaming:
+            frame.lazy().sink_csv(path, datetime_format=datetime_format)
+        else:
+            frame.write_csv(path, datetime_format=datetime_format)
+        return path
+    
+    def fill_summary_row(self, summary, i, symbol, df):
+        """
+        Write the summary metrics for one stock into the summary arrays.
+        
+        Args:
+            summary (dict): Preallocated arrays keyed by summary column
+            i (int): Row of the summary arrays to fill
+            symbol (str): Stock symbol
+            df (DataFrame): Non-empty stock price data
+        """
+        close = df['close'].to_numpy()
+        last_price = close[-1]
+        prev_close = close[-2] if close.size > 1 else last_price
 
-            latest = df.iloc[-1]
-
-            daily_change_pct = ((latest['close'] - df.iloc[-2]['close']) /
-                                df.iloc[-2][
-                                    'close'] * 100) if len(df) > 1 else 0
-
-            week_52_high = df['close'].max()
-            week_52_low = df['close'].min()
-
-            pct_from_high = ((latest['close'] - week_52_high) /
-                             week_52_high * 100)
-            pct_from_low = ((latest['close'] - week_52_low) /
-                            week_52_low * 100)
-            
-            summary_rows.append({
-                'symbol': symbol,
-                'last_price': latest['close'],
-                'daily_change_pct': daily_change_pct,
-                'volume': latest['volume'],
-                'week_52_high': week_52_high,
-                'week_52_low': week_52_low,
-                'pct_from_high': pct_from_high,
-                'pct_from_low': pct_from_low,
-                'date': latest.name.date()
-            })
-        
-        if summary_rows:
-            summary_df = pd.DataFrame(summary_rows)
-            summary_path = os.path.join(self.output_dir, "stock_summary.csv")
-            summary_df.to_csv(summary_path, index=False)
+        week_52_high = np.nanmax(close)
+        week_52_low = np.nanmin(close)
+        
+        summary['symbol'][i] = symbol
+        summary['last_price'][i] = last_price
+        summary['daily_change_pct'][i] = ((last_price - prev_close) /
+                                          prev_close * 100)
+        summary['volume'][i] = df['volume'].iat[-1]
+        summary['week_52_high'][i] = week_52_high
+        summary['week_52_low'][i] = week_52_low
+        summary['pct_from_high'][i] = ((last_price - week_52_high) /
+                                       week_52_high * 100)
+        summary['pct_from_low'][i] = ((last_price - week_52_low) /
+                                      week_52_low * 100)
+        summary['date'][i] = df.index[-1].date()
+    
+    def write_summary(self, summary, count):
+        """Write the first count rows of the summary arrays as a table."""
+        if count:
+            columns = {column: values[:count]
+                       for column, values in summary.items()}
+            columns['volume'] = _compact_volume(columns['volume'])
+            
+            summary_df = pd.DataFrame(columns, copy=False)
+            summary_path = self.write_frame(summary_df, "stock_summary",
+                                            index=False)
             print(f"Saved summary data to {summary_path}")
 
 
@@ -201,10 +616,23 @@ if __name__ == "__main__":
         default='stock_data', 
         help='Output directory (default: stock_data)'
     )
+    parser.add_argument(
+        '--format',
+        choices=['parquet', 'csv'],
+        default='parquet',
+        help='Output file format (default: parquet)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignore the Parquet cache and download the full period'
+    )
     
     args = parser.parse_args()
     
-    analyzer = StockAnalyzer(output_dir=args.output)
+    analyzer = StockAnalyzer(output_dir=args.output,
+                             use_cache=not args.no_cache,
+                             output_format=args.format)
     combined_file = analyzer.process_all_stocks(
         args.symbols, args.period, args.interval
     )
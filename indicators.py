@@ -0,0 +1,312 @@
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True)
+def sma(x, length):
+    """
+    Simple moving average.
+
+    Args:
+        x (ndarray): Input series
+        length (int): Window length
+
+    Returns:
+        ndarray: Rolling mean, NaN until a full window of values is seen
+    """
+    n = len(x)
+    out = np.full(n, np.nan)
+    total = 0.0
+    count = 0
+
+    for i in range(n):
+        if not np.isnan(x[i]):
+            total += x[i]
+            count += 1
+        if i >= length and not np.isnan(x[i - length]):
+            total -= x[i - length]
+            count -= 1
+        if count == length:
+            out[i] = total / length
+
+    return out
+
+
+@njit(cache=True)
+def ema(x, length):
+    """
+    Exponential moving average seeded with the SMA of the first window.
+
+    Args:
+        x (ndarray): Input series
+        length (int): Span of the average
+
+    Returns:
+        ndarray: EMA, NaN before the first full window
+    """
+    n = len(x)
+    out = np.full(n, np.nan)
+    if n < length:
+        return out
+
+    alpha = 2.0 / (length + 1)
+    total = 0.0
+    count = 0
+    for i in range(length):
+        if not np.isnan(x[i]):
+            total += x[i]
+            count += 1
+    if count == 0:
+        return out
+
+    prev = total / count
+    out[length - 1] = prev
+    for i in range(length, n):
+        if not np.isnan(x[i]):
+            prev = alpha * x[i] + (1.0 - alpha) * prev
+        out[i] = prev
+
+    return out
+
+
+@njit(cache=True)
+def _rma(x, length):
+    """Wilder's moving average (adjusted EWM with alpha = 1 / length)."""
+    n = len(x)
+    out = np.full(n, np.nan)
+    decay = 1.0 - 1.0 / length
+    num = 0.0
+    den = 0.0
+    count = 0
+
+    for i in range(n):
+        if np.isnan(x[i]):
+            num *= decay
+            den *= decay
+        else:
+            num = x[i] + decay * num
+            den = 1.0 + decay * den
+            count += 1
+        if count >= length:
+            out[i] = num / den
+
+    return out
+
+
+@njit(cache=True)
+def rsi(close, length):
+    """
+    Relative Strength Index.
+
+    Args:
+        close (ndarray): Closing prices
+        length (int): Lookback period
+
+    Returns:
+        ndarray: RSI between 0 and 100
+    """
+    n = len(close)
+    gain = np.full(n, np.nan)
+    loss = np.full(n, np.nan)
+
+    for i in range(1, n):
+        change = close[i] - close[i - 1]
+        if not np.isnan(change):
+            gain[i] = max(change, 0.0)
+            loss[i] = max(-change, 0.0)
+
+    avg_gain = _rma(gain, length)
+    avg_loss = _rma(loss, length)
+    return 100.0 * avg_gain / (avg_gain + avg_loss)
+
+
+@njit(cache=True)
+def atr(high, low, close, length):
+    """
+    Average True Range.
+
+    Args:
+        high (ndarray): High prices
+        low (ndarray): Low prices
+        close (ndarray): Closing prices
+        length (int): Lookback period
+
+    Returns:
+        ndarray: ATR smoothed with Wilder's moving average
+    """
+    n = len(close)
+    true_range = np.full(n, np.nan)
+
+    for i in range(1, n):
+        high_low = abs(high[i] - low[i])
+        if np.isnan(close[i - 1]):
+            true_range[i] = high_low
+        else:
+            true_range[i] = max(high_low,
+                                abs(high[i] - close[i - 1]),
+                                abs(low[i] - close[i - 1]))
+
+    return _rma(true_range, length)
+
+
+def bbands(close, length, std):
+    """
+    Bollinger Bands using the population standard deviation.
+
+    Window sums come from differences of two cumulative sums, so the whole
+    series is processed in O(N) without a per-window kernel. A 2D input of
+    shape (bars, tickers) is processed column by column.
+
+    Args:
+        close (ndarray): Closing prices
+        length (int): Window length
+        std (float): Number of standard deviations for the bands
+
+    Returns:
+        tuple: Lower, middle and upper bands, bandwidth and %B
+    """
+    c = np.asarray(close, dtype=np.float64)
+    lower, mid, upper, bandwidth, percent = np.full((5,) + c.shape, np.nan)
+    if len(c) < length:
+        return lower, mid, upper, bandwidth, percent
+
+    # Centre on the first valid price so the sum of squares keeps its
+    # precision, and count valid prices so a NaN only blanks its windows.
+    valid = ~np.isnan(c)
+    first = np.expand_dims(valid.argmax(axis=0), 0)
+    centre = np.take_along_axis(c, first, axis=0)[0]
+    shifted = np.where(valid, c - centre, 0.0)
+    zero = np.zeros_like(c[:1])
+    cs = np.concatenate((zero, np.cumsum(shifted, axis=0)))
+    cs2 = np.concatenate((zero, np.cumsum(shifted * shifted, axis=0)))
+    counts = np.concatenate((zero, np.cumsum(valid, axis=0)))
+    full = counts[length:] - counts[:-length] == length
+    mean = (cs[length:] - cs[:-length]) / length
+    var = (cs2[length:] - cs2[:-length]) / length - mean * mean
+    dev = std * np.sqrt(np.maximum(var, 0.0))
+
+    window = slice(length - 1, None)
+    mid[window] = np.where(full, mean + centre, np.nan)
+    lower[window] = mid[window] - dev
+    upper[window] = mid[window] + dev
+    with np.errstate(divide='ignore', invalid='ignore'):
+        bandwidth[window] = (100.0 * (upper[window] - lower[window]) /
+                             mid[window])
+        percent[window] = (c[window] - lower[window]) / (upper[window] -
+                                                         lower[window])
+
+    return lower, mid, upper, bandwidth, percent
+
+
+@njit(cache=True)
+def macd(close, fast, slow, signal):
+    """
+    Moving Average Convergence Divergence.
+
+    Args:
+        close (ndarray): Closing prices
+        fast (int): Fast EMA span
+        slow (int): Slow EMA span
+        signal (int): Signal line span
+
+    Returns:
+        tuple: MACD line, histogram, signal line and the fast and slow EMAs
+    """
+    fast_ema = ema(close, fast)
+    slow_ema = ema(close, slow)
+    line = fast_ema - slow_ema
+    signal_line = np.full(len(close), np.nan)
+
+    first = 0
+    while first < len(line) and np.isnan(line[first]):
+        first += 1
+    signal_line[first:] = ema(line[first:], signal)
+
+    return line, line - signal_line, signal_line, fast_ema, slow_ema
+
+
+@njit(parallel=True, cache=True)
+def sma_2d(x, length):
+    """
+    Simple moving average of every column of a (bars, tickers) matrix.
+
+    Args:
+        x (ndarray): Input series, one ticker per column
+        length (int): Window length
+
+    Returns:
+        ndarray: Rolling means with the same shape as x
+    """
+    out = np.empty(x.shape)
+    for j in prange(x.shape[1]):
+        out[:, j] = sma(x[:, j], length)
+    return out
+
+
+@njit(parallel=True, cache=True)
+def rsi_2d(close, length):
+    """
+    Relative Strength Index of every column of a (bars, tickers) matrix.
+
+    Args:
+        close (ndarray): Closing prices, one ticker per column
+        length (int): Lookback period
+
+    Returns:
+        ndarray: RSI with the same shape as close
+    """
+    out = np.empty(close.shape)
+    for j in prange(close.shape[1]):
+        out[:, j] = rsi(close[:, j], length)
+    return out
+
+
+@njit(parallel=True, cache=True)
+def atr_2d(high, low, close, length):
+    """
+    Average True Range of every column of (bars, tickers) matrices.
+
+    Args:
+        high (ndarray): High prices, one ticker per column
+        low (ndarray): Low prices, one ticker per column
+        close (ndarray): Closing prices, one ticker per column
+        length (int): Lookback period
+
+    Returns:
+        ndarray: ATR with the same shape as close
+    """
+    out = np.empty(close.shape)
+    for j in prange(close.shape[1]):
+        out[:, j] = atr(high[:, j], low[:, j], close[:, j], length)
+    return out
+
+
+@njit(parallel=True, cache=True)
+def macd_2d(close, fast, slow, signal):
+    """
+    MACD of every column of a (bars, tickers) matrix.
+
+    Args:
+        close (ndarray): Closing prices, one ticker per column
+        fast (int): Fast EMA span
+        slow (int): Slow EMA span
+        signal (int): Signal line span
+
+    Returns:
+        tuple: MACD line, histogram, signal line and the fast and slow EMAs
+    """
+    line = np.empty(close.shape)
+    hist = np.empty(close.shape)
+    signal_line = np.empty(close.shape)
+    fast_ema = np.empty(close.shape)
+    slow_ema = np.empty(close.shape)
+
+    for j in prange(close.shape[1]):
+        result = macd(close[:, j], fast, slow, signal)
+        line[:, j] = result[0]
+        hist[:, j] = result[1]
+        signal_line[:, j] = result[2]
+        fast_ema[:, j] = result[3]
+        slow_ema[:, j] = result[4]
+
+    return line, hist, signal_line, fast_ema, slow_ema